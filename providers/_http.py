@@ -0,0 +1,78 @@
+"""Shared keep-alive HTTPS connections for gro python adapters.
+
+One connection is kept per host for the life of the process. Adapters
+imported as providers.<name> into one interpreter share the TCP+TLS
+session to each API host; an adapter run as a one-shot script gets its
+own connection for that single process.
+
+HTTPS_PROXY/https_proxy and no_proxy are honoured as urllib does, by
+tunnelling through the proxy with CONNECT.
+
+Not thread-safe: there is no locking, so use it from one thread only.
+"""
+
+import base64
+import http.client
+import urllib.parse
+import urllib.request
+
+
+TIMEOUT = 60
+
+_CONNS = {}
+
+# Errors meaning the server closed a kept-alive connection before replying.
+_DROPPED = (http.client.RemoteDisconnected, http.client.BadStatusLine, BrokenPipeError,
+            ConnectionResetError)
+
+
+def _connect(host):
+    proxy = urllib.request.getproxies().get("https")
+    if not proxy or urllib.request.proxy_bypass(host):
+        return http.client.HTTPSConnection(host, timeout=TIMEOUT)
+    if "://" not in proxy:
+        proxy = "http://" + proxy
+    p = urllib.parse.urlsplit(proxy)
+    conn = http.client.HTTPSConnection(
+        p.hostname, p.port or (443 if p.scheme == "https" else 80), timeout=TIMEOUT
+    )
+    headers = {}
+    if p.username:
+        creds = f"{urllib.parse.unquote(p.username)}:{urllib.parse.unquote(p.password or '')}"
+        headers["Proxy-Authorization"] = "Basic " + base64.b64encode(creds.encode()).decode()
+    conn.set_tunnel(host, 443, headers)
+    return conn
+
+
+def get_connection(host):
+    conn = _CONNS.get(host)
+    if conn is None:
+        conn = _connect(host)
+        _CONNS[host] = conn
+    return conn
+
+
+def post(host, path, body, headers):
+    """POST on the host's cached connection.
+
+    Retries once on a fresh connection only if a kept-alive connection was
+    dropped by the server; a failure on a new connection is raised as-is,
+    since the POST may already have been processed.
+
+    Returns (status, body bytes).
+    """
+    while True:
+        conn = get_connection(host)
+        # An open socket here was kept alive from an earlier response; after
+        # "Connection: close" http.client drops it and request() reconnects.
+        reused = conn.sock is not None
+        try:
+            conn.request("POST", path, body=body, headers=headers)
+            resp = conn.getresponse()
+            return resp.status, resp.read()
+        except BaseException as e:
+            # Any failure can leave the connection mid-request (timeouts, TLS
+            # errors, short reads), so always drop it before deciding to retry.
+            conn.close()
+            if not reused or not isinstance(e, _DROPPED):
+                raise
@@ -7,25 +7,70 @@ Env: GRO_MODEL, GRO_SYSTEM_PROMPT, OPENAI_API_KEY, GRO_CONFIG_FILE
 import sys
 import os
 import json
-import urllib.request
-import urllib.error
+import http.client
 
+try:
+    from ._http import post
+except ImportError:
+    # Run as a script: providers/ is sys.path[0] rather than a package.
+    from _http import post
 
-TIMEOUT = 60
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+API_HOST = "api.openai.com"
+
+# orjson works in bytes directly and is several times faster than stdlib json;
+# both raise a json.JSONDecodeError subclass on bad input.
+json_loads = orjson.loads if orjson else json.loads
+
+
+def json_dumps(obj):
+    if orjson:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson rejects lone surrogates (e.g. undecodable stdin under a
+            # C locale); stdlib json escapes them as before.
+            pass
+    return json.dumps(obj).encode()
+
+
+# GRO_CONFIG_FILE is fixed for the life of the process; read it once.
+_CFG_PATH = os.environ.get("GRO_CONFIG_FILE") or None
+
+# Parsed GRO_CONFIG_FILE contents keyed by (path, mtime_ns).
+_CFG_CACHE = {}
+
+
+def _load_config():
+    """Return GRO_CONFIG_FILE as a dict, reparsing only when its mtime changes."""
+    if _CFG_PATH is None:
+        return {}
+    try:
+        st = os.stat(_CFG_PATH)
+    except OSError:
+        return {}
+    cache_key = (_CFG_PATH, st.st_mtime_ns)
+    values = _CFG_CACHE.get(cache_key)
+    if values is None:
+        with open(_CFG_PATH) as f:
+            lines = [line.strip() for line in f.read().splitlines()]
+        # Reversed so the first occurrence of a key wins, as with a top-down scan.
+        values = dict(
+            line.split("=", 1)
+            for line in reversed(lines)
+            if "=" in line and not line.startswith("#")
+        )
+        _CFG_CACHE[cache_key] = values
+    return values
 
 
 def load_config_value(key):
-    config_file = os.environ.get("GRO_CONFIG_FILE", "")
-    if not config_file or not os.path.exists(config_file):
-        return ""
-    with open(config_file) as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if line.startswith(f"{key}="):
-                return line.split("=", 1)[1]
-    return ""
+    return _load_config().get(key, "")
 
 
 def main():
@@ -47,30 +92,35 @@ def main():
         messages.append({"role": "system", "content": system_prompt})
     messages.append({"role": "user", "content": prompt})
 
-    body = json.dumps({"model": model, "messages": messages}).encode()
-
-    req = urllib.request.Request(
-        "https://api.openai.com/v1/chat/completions",
-        data=body,
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}",
-        },
-    )
+    body = json_dumps({"model": model, "messages": messages})
 
     try:
-        with urllib.request.urlopen(req, timeout=TIMEOUT) as resp:
-            data = json.loads(resp.read())
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode()
+        status, raw = post(
+            API_HOST,
+            "/v1/chat/completions",
+            body,
+            {
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {api_key}",
+            },
+        )
+    except (OSError, http.client.HTTPException) as e:
+        print(f"gro/openai: network error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if not 200 <= status < 300:
+        error_body = raw.decode(errors="replace")
         try:
-            err = json.loads(error_body)
+            err = json_loads(error_body)
             print(f"gro/openai: {err.get('error', {}).get('message', error_body)}", file=sys.stderr)
         except json.JSONDecodeError:
-            print(f"gro/openai: HTTP {e.code}: {error_body[:200]}", file=sys.stderr)
+            print(f"gro/openai: HTTP {status}: {error_body[:200]}", file=sys.stderr)
         sys.exit(1)
-    except urllib.error.URLError as e:
-        print(f"gro/openai: network error: {e.reason}", file=sys.stderr)
+
+    try:
+        data = json_loads(raw)
+    except json.JSONDecodeError:
+        print(f"gro/openai: invalid JSON response: {raw[:200].decode(errors='replace')}", file=sys.stderr)
         sys.exit(1)
 
     content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
@@ -0,0 +1,54 @@
+"""Scripted local HTTP server for the adapter tests."""
+
+import http.server
+import threading
+
+
+class FakeServer:
+    """Serve POSTs on 127.0.0.1, one scripted reply per request.
+
+    Each reply is (status, body, headers). The string "drop" instead reads
+    the request and closes the socket without answering, and "stall" holds
+    it unanswered until close(). requests counts every POST received.
+    """
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.requests = 0
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                server.requests += 1
+                reply = server.replies.pop(0)
+                if reply == "drop":
+                    self.close_connection = True
+                    return
+                if reply == "stall":
+                    server.release.wait()
+                    self.close_connection = True
+                    return
+                status, body, headers = reply
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(body)))
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.release = threading.Event()
+        self.httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_port
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.release.set()
+        self.httpd.shutdown()
+        self.httpd.server_close()
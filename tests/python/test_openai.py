@@ -0,0 +1,133 @@
+"""Tests for the providers/openai.py adapter.
+
+Run with: npm run test:python
+"""
+
+import contextlib
+import http.client
+import importlib.util
+import io
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+PROVIDERS = Path(__file__).resolve().parents[2] / "providers"
+
+# Load the adapter the way it runs in production: as a script with
+# providers/ on sys.path, under a name that can't shadow the openai SDK.
+sys.path.insert(0, str(PROVIDERS))
+_spec = importlib.util.spec_from_file_location("gro_openai", PROVIDERS / "openai.py")
+openai = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(openai)
+
+import _http  # noqa: E402  (the module openai.post comes from)
+from fake_server import FakeServer  # noqa: E402
+
+
+class LoadConfigValueTest(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.unlink, self.path)
+        openai._CFG_CACHE.clear()
+        patcher = mock.patch.object(openai, "_CFG_PATH", self.path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write(self, text, mtime_ns):
+        with open(self.path, "w") as f:
+            f.write(text)
+        os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_first_occurrence_wins(self):
+        self.write("openai.api-key=first=x\nopenai.api-key=second\n", 10**18)
+        self.assertEqual(openai.load_config_value("openai.api-key"), "first=x")
+
+    def test_comments_and_blank_lines_skipped(self):
+        self.write("# openai.api-key=commented\n\n  openai.api-key=real  \n", 10**18)
+        self.assertEqual(openai.load_config_value("openai.api-key"), "real")
+        self.assertEqual(openai.load_config_value("# openai.api-key"), "")
+
+    def test_unknown_key_returns_empty(self):
+        self.write("a=1\n", 10**18)
+        self.assertEqual(openai.load_config_value("b"), "")
+
+    def test_missing_file_returns_empty(self):
+        with mock.patch.object(openai, "_CFG_PATH", self.path + ".missing"):
+            self.assertEqual(openai.load_config_value("a"), "")
+
+    def test_unset_path_returns_empty(self):
+        with mock.patch.object(openai, "_CFG_PATH", None):
+            self.assertEqual(openai.load_config_value("a"), "")
+
+    def test_mtime_change_reparses(self):
+        self.write("a=1\n", 10**18)
+        self.assertEqual(openai.load_config_value("a"), "1")
+        self.write("a=2\n", 10**18)
+        self.assertEqual(openai.load_config_value("a"), "1")  # same mtime: cached
+        self.write("a=2\n", 10**18 + 1)
+        self.assertEqual(openai.load_config_value("a"), "2")
+
+
+
+class MainTest(unittest.TestCase):
+    host = "gro-test"
+
+    def run_main(self, reply):
+        server = FakeServer([reply])
+        self.addCleanup(server.close)
+        conn = http.client.HTTPConnection("127.0.0.1", server.port, timeout=5)
+        self.addCleanup(conn.close)
+        _http._CONNS[self.host] = conn
+        self.addCleanup(_http._CONNS.pop, self.host, None)
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with mock.patch.object(openai, "API_HOST", self.host), \
+                mock.patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test"}), \
+                mock.patch.object(sys, "stdin", io.StringIO("hello")), \
+                contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                openai.main()
+                code = 0
+            except SystemExit as e:
+                code = e.code
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def test_success_prints_content(self):
+        body = b'{"choices": [{"message": {"content": " hi there \\n"}}]}'
+        self.assertEqual(self.run_main((200, body, {})), (0, "hi there\n", ""))
+
+    def test_api_error_message(self):
+        body = b'{"error": {"message": "bad key"}}'
+        code, _, err = self.run_main((401, body, {}))
+        self.assertEqual((code, err), (1, "gro/openai: bad key\n"))
+
+    def test_redirect_is_an_error(self):
+        code, out, err = self.run_main((302, b"<html>moved</html>", {"Location": "/x"}))
+        self.assertEqual((code, out), (1, ""))
+        self.assertEqual(err, "gro/openai: HTTP 302: <html>moved</html>\n")
+
+    def test_invalid_json_success_body(self):
+        code, out, err = self.run_main((200, b"<html>proxy</html>", {}))
+        self.assertEqual((code, out), (1, ""))
+        self.assertTrue(err.startswith("gro/openai: invalid JSON response:"), err)
+
+
+
+class JsonDumpsTest(unittest.TestCase):
+    def test_round_trips_unicode(self):
+        self.assertEqual(openai.json_loads(openai.json_dumps({"a": "café"})), {"a": "café"})
+
+    @unittest.skipUnless(openai.orjson, "orjson not installed")
+    def test_lone_surrogate_falls_back_to_stdlib(self):
+        # Undecodable stdin under a C locale arrives as lone surrogates.
+        obj = {"content": "caf\udce9"}
+        with self.assertRaises(TypeError):
+            openai.orjson.dumps(obj)
+        self.assertEqual(openai.json_dumps(obj), b'{"content": "caf\\udce9"}')
+
+
+if __name__ == "__main__":
+    unittest.main()